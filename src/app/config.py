@@ -37,6 +37,10 @@ class Settings(BaseSettings):
     # Session Settings
     SESSION_TTL_SECONDS: int = 3600  # Session expiry time (default: 1 hour)
     SESSION_CLEANUP_INTERVAL_SECONDS: int = 300  # Cleanup interval (default: 5 minutes)
+    SESSION_MAX_ENTRIES: int = 10000  # LRU cap on in-memory sessions
+    SESSION_BACKEND: Literal["memory", "redis"] = "memory"
+    REDIS_URL: str | None = None  # Required when SESSION_BACKEND is "redis"
+    FLOW_REPLAY_TTL_SECONDS: int = 0  # Replay identical START results (0 = off)
 
     @model_validator(mode="after")
     def validate_api_key_for_production(self) -> "Settings":
@@ -48,6 +52,16 @@ class Settings(BaseSettings):
             )
         return self
 
+    @model_validator(mode="after")
+    def validate_redis_url_for_redis_backend(self) -> "Settings":
+        """Validate REDIS_URL is set when sessions are stored in Redis."""
+        if self.SESSION_BACKEND == "redis" and not self.REDIS_URL:
+            raise ValueError(
+                "REDIS_URL is required when SESSION_BACKEND is 'redis'. "
+                "Set the REDIS_URL environment variable."
+            )
+        return self
+
     @property
     def is_development(self) -> bool:
         """Check if running in development mode."""
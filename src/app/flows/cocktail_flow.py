@@ -71,6 +71,7 @@ class CocktailFlowState(BaseModel):
         analysis: Structured output from Analysis Crew.
         candidates: List of candidate drinks (derived from analysis).
         selected: ID of the selected drink for recipe generation.
+        alternatives: Candidates other than the selected drink.
         recipe: Structured recipe data from Recipe Crew.
         bottle_advice: Structured bottle recommendations from Recipe Crew.
         rejected: List of drink IDs rejected in this session.
@@ -126,6 +127,11 @@ class CocktailFlowState(BaseModel):
         default=None,
         description="ID of the drink selected for recipe generation",
     )
+    alternatives: list[dict[str, Any]] | None = Field(
+        default=None,
+        exclude=True,
+        description="Candidates other than the selected drink (derived, not persisted)",
+    )
 
     # Structured Recipe output
     recipe: RecipeOutput | None = Field(
@@ -165,6 +171,22 @@ class CocktailFlowState(BaseModel):
         description="Raw output from Recipe Crew",
     )
 
+    def mark_made(self, drink_id: str) -> bool:
+        """Record a drink as made, ignoring drinks already in recent_history.
+
+        Args:
+            drink_id: ID of the drink that was made.
+
+        Returns:
+            True if the drink was added, False if it was already recorded.
+        """
+        # recent_history is a short per-session list, so a linear scan is
+        # cheaper than keeping a separate index in step with it
+        if drink_id in self.recent_history:
+            return False
+        self.recent_history.append(drink_id)
+        return True
+
 
 class CocktailFlow(Flow[CocktailFlowState]):
     """Main orchestration flow for cocktail recommendations.
@@ -327,6 +349,11 @@ class CocktailFlow(Flow[CocktailFlowState]):
                 ]
                 # Select the top candidate
                 self.state.selected = self.state.analysis.candidates[0].id
+                self.state.alternatives = [
+                    candidate
+                    for candidate in self.state.candidates
+                    if candidate.get("id") != self.state.selected
+                ]
                 logger.info(
                     f"Analysis complete: {len(self.state.candidates)} candidates, "
                     f"selected={self.state.selected}"
@@ -16,7 +16,15 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from src.app.config import get_settings
 from src.app.routers import api_router
-from src.app.services.data_loader import load_all_drinks
+from src.app.services.data_loader import (
+    load_all_drinks,
+    load_async,
+    load_drinks_by_id,
+    load_ingredient_display_names,
+    load_ingredients,
+    load_substitutions,
+    load_unlock_scores,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +60,7 @@ async def session_cleanup_task() -> None:
             await asyncio.sleep(settings.SESSION_CLEANUP_INTERVAL_SECONDS)
 
             # Clean up flow sessions
-            flow_cleaned = cleanup_expired_sessions()
+            flow_cleaned = await cleanup_expired_sessions()
 
             # Clean up chat sessions
             chat_cleaned = cleanup_expired_chat_sessions()
@@ -60,10 +68,11 @@ async def session_cleanup_task() -> None:
             # Log summary if any sessions were cleaned
             total_cleaned = flow_cleaned + chat_cleaned
             if total_cleaned > 0:
+                flow_active = await get_session_count()
                 logger.info(
                     f"Session cleanup completed: "
                     f"removed {flow_cleaned} flow + {chat_cleaned} chat sessions. "
-                    f"Active: {get_session_count()} flow, {get_chat_session_count()} chat"
+                    f"Active: {flow_active} flow, {get_chat_session_count()} chat"
                 )
 
         except asyncio.CancelledError:
@@ -77,8 +86,19 @@ async def session_cleanup_task() -> None:
 async def lifespan(app: FastAPI):
     """Manage application lifespan resources.
 
-    Starts background cleanup task for expired sessions.
+    Warms the catalog caches and starts the background cleanup task for
+    expired sessions.
     """
+    # Parse and validate the data files off the event loop before serving,
+    # so the first request does not pay for it
+    await asyncio.gather(
+        load_async(load_all_drinks),
+        load_async(load_ingredients),
+        load_async(load_ingredient_display_names),
+        load_async(load_substitutions),
+        load_async(load_unlock_scores),
+    )
+
     # Start background cleanup task
     cleanup_task = asyncio.create_task(session_cleanup_task())
 
@@ -93,6 +113,11 @@ async def lifespan(app: FastAPI):
     except asyncio.CancelledError:
         pass
 
+    # Close the session store's connections (Redis client pool)
+    from src.app.routers.flow import close_session_store
+
+    await close_session_store()
+
     logger.info("Application shutdown complete")
 
 
@@ -173,10 +198,9 @@ async def drink_detail(request: Request, drink_id: str) -> HTMLResponse:
         HTTPException: If drink is not found.
     """
     # Validate drink exists before rendering page
-    all_drinks = load_all_drinks()
-    drink_ids = {d.id for d in all_drinks}
+    drinks_by_id = await load_async(load_drinks_by_id)
 
-    if drink_id not in drink_ids:
+    if drink_id not in drinks_by_id:
         raise HTTPException(status_code=404, detail=f"Drink not found: {drink_id}")
 
     return templates.TemplateResponse(
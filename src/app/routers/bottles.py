@@ -8,18 +8,30 @@ Global rate limits protect compute-intensive operations (privacy-first, no user
 """
 
 import logging
-from collections import defaultdict
+from collections import Counter, defaultdict
+from functools import lru_cache
 
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
 from src.app.rate_limit import rate_limit_compute
+from src.app.services.data_loader import derived_cache
+from src.app.utils.text import ingredient_display_name
 
 logger = logging.getLogger(__name__)
 
 # Create the API router
 router = APIRouter(tags=["bottles"])
 
+# Number of makeable drink names included in the AI prompt
+MAKEABLE_PREVIEW_LIMIT = 10
+
+# Number of unlocked drinks listed per bottle recommendation
+UNLOCKED_DRINKS_LIMIT = 10
+
+# Number of missing essentials returned, ranked by usage
+MISSING_ESSENTIALS_LIMIT = 5
+
 
 # =============================================================================
 # Models
@@ -117,60 +129,199 @@ class SuggestBottlesResponse(BaseModel):
 # =============================================================================
 
 
-def _smart_title_case(text: str) -> str:
-    """Convert text to title case, handling apostrophes correctly."""
-    if not text:
-        return text
-    words = text.split()
-    result = []
-    for word in words:
-        if "'" in word:
-            parts = word.split("'")
-            titled = parts[0].capitalize() + "'" + "'".join(parts[1:]).lower()
-            result.append(titled)
-        else:
-            result.append(word.capitalize())
-    return " ".join(result)
+@derived_cache
+@lru_cache(maxsize=1)
+def _load_ingredient_category_sets() -> tuple[frozenset[str], ...]:
+    """Load ingredient IDs per category as frozensets.
 
+    Returns:
+        Tuple of (spirits, modifiers, non_alcoholic, bitters_syrups, fresh,
+        mixers) ID sets. The ingredients database is static per process,
+        so the sets are built once.
+    """
+    from src.app.services.data_loader import load_ingredients
 
-def _get_ingredient_display_name(ingredient_id: str) -> str:
-    """Convert ingredient ID to human-readable name."""
-    return _smart_title_case(ingredient_id.replace("-", " "))
+    ingredients_db = load_ingredients()
+    return tuple(
+        frozenset(ing.id for ing in category)
+        for category in (
+            ingredients_db.spirits,
+            ingredients_db.modifiers,
+            ingredients_db.non_alcoholic,
+            ingredients_db.bitters_syrups,
+            ingredients_db.fresh,
+            ingredients_db.mixers,
+        )
+    )
 
 
-def _is_core_bottle(ingredient_id: str) -> bool:
-    """Check if an ingredient is a Core Bottle.
+@derived_cache
+@lru_cache(maxsize=1)
+def _load_core_bottle_ids() -> tuple[str, ...]:
+    """Load the Core Bottle IDs in bitmask order.
 
-    Core Bottles are spirits, modifiers, and non-alcoholic bases that
-    form the foundation of a home bar.
+    Returns:
+        Sorted tuple of Core Bottle IDs; each ID's index is its bit position
     """
-    from src.app.services.data_loader import load_ingredients
+    spirits_ids, modifiers_ids, non_alcoholic_ids, *_ = _load_ingredient_category_sets()
+    return tuple(sorted(spirits_ids | modifiers_ids | non_alcoholic_ids))
 
-    ingredients_db = load_ingredients()
 
-    spirits_ids = {ing.id for ing in ingredients_db.spirits}
-    modifiers_ids = {ing.id for ing in ingredients_db.modifiers}
-    non_alcoholic_ids = {ing.id for ing in ingredients_db.non_alcoholic}
+@derived_cache
+@lru_cache(maxsize=1)
+def _load_core_bottle_bits() -> dict[str, int]:
+    """Load the bit position of each Core Bottle ID."""
+    return {ing_id: bit for bit, ing_id in enumerate(_load_core_bottle_ids())}
 
-    return (
-        ingredient_id in spirits_ids
-        or ingredient_id in modifiers_ids
-        or ingredient_id in non_alcoholic_ids
-    )
 
+@derived_cache
+@lru_cache(maxsize=1)
+def _load_drink_requirements() -> dict[str, tuple[int, frozenset[str]]]:
+    """Load the Core Bottles and Essentials each drink needs.
 
-def _is_essential_item(ingredient_id: str) -> bool:
-    """Check if an ingredient is an Essential item.
+    Both are functions of the static drink catalog and ingredient
+    categories, so they are derived once rather than on every request.
+    Core Bottles are encoded as a bitmask over _load_core_bottle_ids() so
+    matching a cabinet is a couple of integer operations per drink.
 
-    Essential items are bitters and specialty syrups that enhance
-    drinks but are not Core Bottles.
+    Returns:
+        Dictionary mapping drink IDs to (core_bottle_mask, essentials)
     """
-    from src.app.services.data_loader import load_ingredients
+    from src.app.services.data_loader import load_drink_ingredient_sets
 
-    ingredients_db = load_ingredients()
-    bitters_syrups_ids = {ing.id for ing in ingredients_db.bitters_syrups}
+    bitters_syrups_ids = _load_ingredient_category_sets()[3]
+    core_bottle_bits = _load_core_bottle_bits()
+
+    requirements = {}
+    for drink_id, ingredients in load_drink_ingredient_sets().items():
+        core_mask = 0
+        for ing_id in ingredients & core_bottle_bits.keys():
+            core_mask |= 1 << core_bottle_bits[ing_id]
+        requirements[drink_id] = (core_mask, ingredients & bitters_syrups_ids)
+    return requirements
+
+
+@derived_cache
+@lru_cache(maxsize=1)
+def _load_unlocked_drinks() -> dict[str, UnlockedDrink]:
+    """Load the UnlockedDrink summary of every drink.
+
+    The summaries only depend on the static catalog, so they are built once
+    and shared across responses. Drinks were validated when the catalog was
+    loaded, so the summaries skip re-validation.
+
+    Returns:
+        Dictionary mapping drink IDs to UnlockedDrink models
+    """
+    from src.app.services.data_loader import load_all_drinks
+
+    return {
+        drink.id: UnlockedDrink.model_construct(
+            id=drink.id,
+            name=drink.name,
+            is_mocktail=drink.is_mocktail,
+            difficulty=drink.difficulty,
+        )
+        for drink in load_all_drinks()
+    }
+
+
+@derived_cache
+@lru_cache(maxsize=512)
+def _compute_suggestions(
+    drink_type: str, cabinet_set: frozenset[str], limit: int
+) -> tuple[SuggestBottlesResponse, tuple[str, ...], tuple[str, ...]]:
+    """Compute the deterministic (non-AI) part of the bottle suggestions.
+
+    The result is a pure function of the static catalog and the request,
+    so repeated lookups for the same cabinet are served from the cache.
+    The drink catalog and ingredients must already be loaded.
+
+    Args:
+        drink_type: Filter by drink type: 'cocktails', 'mocktails', or 'both'.
+        cabinet_set: Normalized ingredient IDs in the user's cabinet.
+        limit: Maximum number of recommendations to return.
+
+    Returns:
+        Tuple of (suggestions without AI fields, sorted Core Bottles in the
+        cabinet, preview of makeable drink names).
+    """
+    from src.app.services.data_loader import load_drinks_by_type
+
+    drink_requirements = _load_drink_requirements()
+    core_bottle_ids = _load_core_bottle_ids()
+    core_bottle_bits = _load_core_bottle_bits()
+    core_cabinet = cabinet_set & core_bottle_bits.keys()
+    cabinet_mask = 0
+    for ing_id in core_cabinet:
+        cabinet_mask |= 1 << core_bottle_bits[ing_id]
+
+    # Drinks are pre-partitioned by type when the catalog is loaded
+    filtered_drinks = load_drinks_by_type(drink_type)
+
+    # Single pass over the drinks: makeable drinks feed the essentials
+    # usage counts, drinks missing exactly one Core Bottle feed the
+    # recommendations
+    drinks_makeable = 0
+    makeable_preview: list[str] = []
+    unlocked_drinks = _load_unlocked_drinks()
+    # Per-bottle unlock counts, with only a bounded preview of the drinks
+    unlock_counts: Counter[str] = Counter()
+    unlock_previews: dict[str, list[UnlockedDrink]] = defaultdict(list)
+    essential_usage: Counter[str] = Counter()
 
-    return ingredient_id in bitters_syrups_ids
+    for drink in filtered_drinks:
+        core_mask, drink_essentials = drink_requirements[drink.id]
+        missing_mask = core_mask & ~cabinet_mask
+
+        if not missing_mask:
+            drinks_makeable += 1
+            if len(makeable_preview) < MAKEABLE_PREVIEW_LIMIT:
+                makeable_preview.append(drink.name)
+            for ing in drink_essentials - cabinet_set:
+                essential_usage[ing] += 1
+        elif missing_mask.bit_count() == 1:
+            bottle_id = core_bottle_ids[missing_mask.bit_length() - 1]
+            unlock_counts[bottle_id] += 1
+            preview = unlock_previews[bottle_id]
+            if len(preview) < UNLOCKED_DRINKS_LIMIT:
+                preview.append(unlocked_drinks[drink.id])
+
+    # Rank candidate bottles on plain counts and only build response models
+    # for the ones that make the cut. Candidates come from missing Core
+    # Bottle bits, so they are never already in the cabinet. Every value
+    # below is derived from the validated catalog, so models are built with
+    # model_construct rather than re-validated.
+    top_recommendations = [
+        BottleRecommendation.model_construct(
+            ingredient_id=ing_id,
+            ingredient_name=ingredient_display_name(ing_id),
+            new_drinks_unlocked=unlock_count,
+            drinks=unlock_previews[ing_id],
+        )
+        for ing_id, unlock_count in unlock_counts.most_common(limit)
+    ]
+
+    # Rank missing essentials by how many makeable drinks use them
+    missing_essentials = [
+        EssentialStatus.model_construct(
+            ingredient_id=essential_id,
+            ingredient_name=ingredient_display_name(essential_id),
+            used_in_drinks=usage_count,
+        )
+        for essential_id, usage_count in essential_usage.most_common(
+            MISSING_ESSENTIALS_LIMIT
+        )
+    ]
+
+    suggestions = SuggestBottlesResponse.model_construct(
+        cabinet_size=len(core_cabinet),
+        drinks_makeable_now=drinks_makeable,
+        recommendations=top_recommendations,
+        total_available_recommendations=len(unlock_counts),
+        missing_essentials=missing_essentials,
+    )
+    return suggestions, tuple(sorted(core_cabinet)), tuple(makeable_preview)
 
 
 # =============================================================================
@@ -195,114 +346,28 @@ async def suggest_bottles(
     Returns:
         SuggestBottlesResponse with ranked recommendations and AI advice.
     """
-    from src.app.services.data_loader import load_all_drinks
+    from src.app.services.data_loader import (
+        load_all_drinks,
+        load_async,
+        load_ingredients,
+    )
 
     logger.info(
         f"Suggest bottles request: cabinet_size={len(bottles_request.cabinet)}, "
         f"drink_type={bottles_request.drink_type}, limit={bottles_request.limit}"
     )
 
-    cabinet_set = {ing.lower().strip() for ing in bottles_request.cabinet}
-    all_drinks = load_all_drinks()
-
-    # Filter by drink type
-    filtered_drinks = []
-    for drink in all_drinks:
-        if bottles_request.drink_type == "cocktails" and drink.is_mocktail:
-            continue
-        if bottles_request.drink_type == "mocktails" and not drink.is_mocktail:
-            continue
-        filtered_drinks.append(drink)
-
-    # Calculate makeable drinks
-    drinks_makeable_list: list[str] = []
-    for drink in filtered_drinks:
-        drink_ingredients = {ing.item.lower() for ing in drink.ingredients}
-        core_bottles_needed = {ing for ing in drink_ingredients if _is_core_bottle(ing)}
-        if core_bottles_needed.issubset(cabinet_set):
-            drinks_makeable_list.append(drink.name)
-
-    drinks_makeable = len(drinks_makeable_list)
-
-    # Count which bottles would unlock the most drinks
-    ingredient_drinks: dict[str, list[dict]] = defaultdict(list)
-
-    for drink in filtered_drinks:
-        drink_ingredients = {ing.item.lower() for ing in drink.ingredients}
-        core_bottles_needed = {ing for ing in drink_ingredients if _is_core_bottle(ing)}
-
-        if core_bottles_needed.issubset(cabinet_set):
-            continue
-
-        missing_core = core_bottles_needed - cabinet_set
-
-        if len(missing_core) == 1:
-            bottle_id = next(iter(missing_core))
-            ingredient_drinks[bottle_id].append(
-                {
-                    "id": drink.id,
-                    "name": drink.name,
-                    "is_mocktail": drink.is_mocktail,
-                    "difficulty": drink.difficulty,
-                }
-            )
-
-    # Build recommendations
-    all_recommendations = []
-    for ing_id, drinks_list in ingredient_drinks.items():
-        if ing_id in cabinet_set:
-            continue
-
-        if not _is_core_bottle(ing_id):
-            continue
-
-        all_recommendations.append(
-            BottleRecommendation(
-                ingredient_id=ing_id,
-                ingredient_name=_get_ingredient_display_name(ing_id),
-                new_drinks_unlocked=len(drinks_list),
-                drinks=[
-                    UnlockedDrink(
-                        id=d["id"],
-                        name=d["name"],
-                        is_mocktail=d["is_mocktail"],
-                        difficulty=d["difficulty"],
-                    )
-                    for d in drinks_list[:10]
-                ],
-            )
-        )
-
-    all_recommendations.sort(key=lambda x: x.new_drinks_unlocked, reverse=True)
-    top_recommendations = all_recommendations[: bottles_request.limit]
-
-    # Track missing essentials
-    missing_essentials: list[EssentialStatus] = []
-    essential_usage: dict[str, int] = defaultdict(int)
-
-    for drink in filtered_drinks:
-        drink_ingredients = {ing.item.lower() for ing in drink.ingredients}
-        core_bottles_needed = {ing for ing in drink_ingredients if _is_core_bottle(ing)}
-
-        if core_bottles_needed.issubset(cabinet_set):
-            for ing in drink_ingredients:
-                if _is_essential_item(ing) and ing not in cabinet_set:
-                    essential_usage[ing] += 1
-
-    for essential_id, usage_count in sorted(
-        essential_usage.items(), key=lambda x: x[1], reverse=True
-    ):
-        if usage_count > 0:
-            missing_essentials.append(
-                EssentialStatus(
-                    ingredient_id=essential_id,
-                    ingredient_name=_get_ingredient_display_name(essential_id),
-                    used_in_drinks=usage_count,
-                )
-            )
-
-    core_bottles_in_cabinet = sum(1 for ing in cabinet_set if _is_core_bottle(ing))
-    core_bottles_list = [ing for ing in cabinet_set if _is_core_bottle(ing)]
+    cabinet_set = frozenset(ing.lower().strip() for ing in bottles_request.cabinet)
+    # Warm the drink catalog and ingredient categories off the event loop
+    await load_async(load_all_drinks)
+    await load_async(load_ingredients)
+    suggestions, core_cabinet, makeable_preview = _compute_suggestions(
+        bottles_request.drink_type, cabinet_set, bottles_request.limit
+    )
+    top_recommendations = suggestions.recommendations
+    missing_essentials = suggestions.missing_essentials
+    core_bottles_in_cabinet = suggestions.cabinet_size
+    drinks_makeable = suggestions.drinks_makeable_now
 
     # AI Enhancement
     ai_summary: str | None = None
@@ -315,18 +380,14 @@ async def suggest_bottles(
             from src.app.crews.bar_growth_crew import run_bar_growth_crew
 
             cabinet_formatted = ", ".join(
-                _get_ingredient_display_name(b) for b in sorted(core_bottles_list)
+                ingredient_display_name(b) for b in core_cabinet
             )
             cabinet_formatted += f" ({core_bottles_in_cabinet} bottles)"
 
             makeable_formatted = (
                 f"You can make {drinks_makeable} drinks"
-                + (
-                    f": {', '.join(drinks_makeable_list[:10])}"
-                    if drinks_makeable_list
-                    else ""
-                )
-                + ("..." if len(drinks_makeable_list) > 10 else "")
+                + (f": {', '.join(makeable_preview)}" if makeable_preview else "")
+                + ("..." if drinks_makeable > MAKEABLE_PREVIEW_LIMIT else "")
             )
 
             ranked_bottles_formatted = chr(10).join(
@@ -339,7 +400,7 @@ async def suggest_bottles(
                 "Missing: "
                 + ", ".join(
                     f"{e.ingredient_name} (in {e.used_in_drinks} drinks)"
-                    for e in missing_essentials[:5]
+                    for e in missing_essentials
                 )
                 if missing_essentials
                 else "No essential items missing."
@@ -363,14 +424,11 @@ async def suggest_bottles(
         except Exception as e:
             logger.warning(f"AI bar growth crew failed, returning without AI: {e}")
 
-    return SuggestBottlesResponse(
-        cabinet_size=core_bottles_in_cabinet,
-        drinks_makeable_now=drinks_makeable,
-        recommendations=top_recommendations,
-        total_available_recommendations=len(all_recommendations),
-        ai_summary=ai_summary,
-        ai_top_reasoning=ai_top_reasoning,
-        essentials_note=essentials_note,
-        next_milestone=next_milestone,
-        missing_essentials=missing_essentials[:5],
+    return suggestions.model_copy(
+        update={
+            "ai_summary": ai_summary,
+            "ai_top_reasoning": ai_top_reasoning,
+            "essentials_note": essentials_note,
+            "next_milestone": next_milestone,
+        }
     )
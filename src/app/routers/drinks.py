@@ -4,11 +4,17 @@ This module provides endpoints for browsing, searching, and viewing
 cocktail and mocktail recipes, as well as ingredient data.
 """
 
+import hashlib
 import logging
+import sys
+from functools import lru_cache
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 
+from src.app.services.data_loader import derived_cache
+from src.app.utils.text import smart_title_case
+
 logger = logging.getLogger(__name__)
 
 # Create the router with prefix and tags
@@ -95,82 +101,92 @@ CATEGORY_CONFIG = {
     "non_alcoholic": {"display": "Non-Alcoholic", "default_emoji": "🧃"},
 }
 
+# Keys are interned so lookups with interned ingredient IDs (see data_loader)
+# hit the identity fast path instead of a full string compare. CPython only
+# auto-interns identifier-like literals, not hyphenated IDs like "irish-whiskey"
 INGREDIENT_EMOJIS = {
-    "bourbon": "🥃",
-    "rye": "🥃",
-    "scotch": "🥃",
-    "irish-whiskey": "🥃",
-    "gin": "🍸",
-    "vodka": "🍸",
-    "white-rum": "🥃",
-    "dark-rum": "🥃",
-    "tequila": "🌵",
-    "mezcal": "🌵",
-    "cognac": "🍷",
-    "brandy": "🍷",
-    "campari": "🔴",
-    "aperol": "🍊",
-    "sweet-vermouth": "🍷",
-    "dry-vermouth": "🍸",
-    "cointreau": "🍊",
-    "amaretto": "🌰",
-    "kahlua": "☕",
-    "chartreuse": "🌿",
-    "maraschino": "🍒",
-    "angostura": "💧",
-    "orange-bitters": "🍊",
-    "simple-syrup": "🍯",
-    "honey-syrup": "🍯",
-    "grenadine": "🍒",
-    "lemon-juice": "🍋",
-    "lime-juice": "🍋",
-    "orange-juice": "🍊",
-    "grapefruit-juice": "🍊",
-    "pineapple-juice": "🍍",
-    "cranberry-juice": "🍒",
-    "mint": "🌿",
-    "ginger": "🫚",
-    "cucumber": "🥒",
-    "egg-white": "🥚",
-    "cream": "🥛",
-    "soda-water": "💧",
-    "tonic-water": "💧",
-    "ginger-beer": "🍺",
-    "cola": "🥤",
-    "champagne": "🥂",
-    "prosecco": "🥂",
+    sys.intern(ingredient_id): emoji
+    for ingredient_id, emoji in {
+        "bourbon": "🥃",
+        "rye": "🥃",
+        "scotch": "🥃",
+        "irish-whiskey": "🥃",
+        "gin": "🍸",
+        "vodka": "🍸",
+        "white-rum": "🥃",
+        "dark-rum": "🥃",
+        "tequila": "🌵",
+        "mezcal": "🌵",
+        "cognac": "🍷",
+        "brandy": "🍷",
+        "campari": "🔴",
+        "aperol": "🍊",
+        "sweet-vermouth": "🍷",
+        "dry-vermouth": "🍸",
+        "cointreau": "🍊",
+        "amaretto": "🌰",
+        "kahlua": "☕",
+        "chartreuse": "🌿",
+        "maraschino": "🍒",
+        "angostura": "💧",
+        "orange-bitters": "🍊",
+        "simple-syrup": "🍯",
+        "honey-syrup": "🍯",
+        "grenadine": "🍒",
+        "lemon-juice": "🍋",
+        "lime-juice": "🍋",
+        "orange-juice": "🍊",
+        "grapefruit-juice": "🍊",
+        "pineapple-juice": "🍍",
+        "cranberry-juice": "🍒",
+        "mint": "🌿",
+        "ginger": "🫚",
+        "cucumber": "🥒",
+        "egg-white": "🥚",
+        "cream": "🥛",
+        "soda-water": "💧",
+        "tonic-water": "💧",
+        "ginger-beer": "🍺",
+        "cola": "🥤",
+        "champagne": "🥂",
+        "prosecco": "🥂",
+    }.items()
+}
+
+
+# Category fallback emojis, flattened out of CATEGORY_CONFIG
+_DEFAULT_EMOJI_BY_CATEGORY = {
+    category: config["default_emoji"] for category, config in CATEGORY_CONFIG.items()
 }
 
 
 def _get_ingredient_emoji(ingredient_id: str, category: str) -> str:
-    if ingredient_id in INGREDIENT_EMOJIS:
-        return INGREDIENT_EMOJIS[ingredient_id]
-    return CATEGORY_CONFIG.get(category, {}).get("default_emoji", "🍹")
-
-
-def _smart_title_case(text: str) -> str:
-    if not text:
-        return text
-    words = text.split()
-    result = []
-    for word in words:
-        if "'" in word:
-            parts = word.split("'")
-            titled = parts[0].capitalize() + "'" + "'".join(parts[1:]).lower()
-            result.append(titled)
-        else:
-            result.append(word.capitalize())
-    return " ".join(result)
+    return INGREDIENT_EMOJIS.get(ingredient_id) or _DEFAULT_EMOJI_BY_CATEGORY.get(
+        category, "🍹"
+    )
 
 
 def _format_ingredient_name(names: list[str]) -> str:
     if not names:
         return "Unknown"
-    return _smart_title_case(names[0])
+    return smart_title_case(names[0])
 
 
-@router.get("", response_model=DrinksResponse)
-async def get_drinks() -> DrinksResponse:
+# Browsers and proxies may reuse the drink catalog for a few minutes
+DRINKS_CACHE_CONTROL = "public, max-age=300"
+
+
+@derived_cache
+@lru_cache(maxsize=1)
+def _build_drinks_payload() -> tuple[bytes, str]:
+    """Serialize the drink catalog once and derive its ETag.
+
+    The catalog is static for the life of the process, so the JSON body
+    is built a single time and served as raw bytes on every request.
+
+    Returns:
+        Tuple of (JSON body bytes, quoted ETag value).
+    """
     from src.app.services.data_loader import load_all_drinks
 
     all_drinks = load_all_drinks()
@@ -187,15 +203,47 @@ async def get_drinks() -> DrinksResponse:
         )
         for drink in all_drinks
     ]
-    return DrinksResponse(drinks=drinks, total=len(drinks))
+    body = DrinksResponse(drinks=drinks, total=len(drinks)).model_dump_json().encode()
+    etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+    return body, etag
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw If-None-Match header value, if any.
+        etag: Quoted ETag of the current representation.
+
+    Returns:
+        True if the header is "*" or lists the ETag, with or without W/.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+@router.get("", response_model=DrinksResponse)
+async def get_drinks(request: Request) -> Response:
+    from src.app.services.data_loader import load_async
+
+    body, etag = await load_async(_build_drinks_payload)
+    headers = {"ETag": etag, "Cache-Control": DRINKS_CACHE_CONTROL}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/{drink_id}", response_model=DrinkDetailResponse)
 async def get_drink_by_id(drink_id: str) -> DrinkDetailResponse:
-    from src.app.services.data_loader import load_all_drinks
+    from src.app.services.data_loader import load_async, load_drinks_by_id
 
-    all_drinks = load_all_drinks()
-    drink = next((d for d in all_drinks if d.id == drink_id), None)
+    drink = (await load_async(load_drinks_by_id)).get(drink_id)
     if not drink:
         raise HTTPException(status_code=404, detail=f"Drink not found: {drink_id}")
     return DrinkDetailResponse(
@@ -222,8 +270,14 @@ async def get_drink_by_id(drink_id: str) -> DrinkDetailResponse:
 ingredients_router = APIRouter(tags=["drinks"])
 
 
-@ingredients_router.get("/ingredients", response_model=IngredientsResponse)
-async def get_ingredients() -> IngredientsResponse:
+@derived_cache
+@lru_cache(maxsize=1)
+def _build_ingredients_payload() -> bytes:
+    """Serialize the ingredient categories once.
+
+    Returns:
+        JSON body bytes of the IngredientsResponse.
+    """
     from src.app.services.data_loader import load_ingredients
 
     ingredients_db = load_ingredients()
@@ -241,4 +295,12 @@ async def get_ingredients() -> IngredientsResponse:
         ]
         if items:
             categories[display_name] = items
-    return IngredientsResponse(categories=categories)
+    return IngredientsResponse(categories=categories).model_dump_json().encode()
+
+
+@ingredients_router.get("/ingredients", response_model=IngredientsResponse)
+async def get_ingredients() -> Response:
+    from src.app.services.data_loader import load_async
+
+    body = await load_async(_build_ingredients_payload)
+    return Response(content=body, media_type="application/json")
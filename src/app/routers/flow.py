@@ -8,12 +8,16 @@ Global rate limits protect upstream API quotas (privacy-first, no user tracking)
 - /flow: 10/min (LLM calls - expensive)
 """
 
+import hashlib
+import json
 import logging
-import time
+import uuid
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
 from enum import Enum
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel, Field
 
 from src.app.config import get_settings
@@ -28,45 +32,85 @@ from src.app.models import (
     SkillLevel,
 )
 from src.app.rate_limit import rate_limit_llm
+from src.app.services.data_loader import load_ingredient_display_names
+from src.app.services.session_store import (
+    InMemorySessionStore,
+    RedisSessionStore,
+    SessionStore,
+)
+from src.app.utils.text import ingredient_display_name
 
 logger = logging.getLogger(__name__)
 
 # Create the API router
 router = APIRouter(tags=["flow"])
 
-# In-memory session storage for MVP
-# In production, this would be Redis or similar persistent store
-# Each entry stores (state, created_timestamp) for TTL-based cleanup
-_sessions: dict[str, tuple[CocktailFlowState, float]] = {}
 
+def _create_session_store() -> SessionStore[CocktailFlowState]:
+    """Create the session store selected by SESSION_BACKEND."""
+    settings = get_settings()
+    if settings.SESSION_BACKEND == "redis" and settings.REDIS_URL:
+        return RedisSessionStore.from_url(
+            settings.REDIS_URL,
+            state_type=CocktailFlowState,
+            ttl_seconds=settings.SESSION_TTL_SECONDS,
+            key_prefix="flow:",
+        )
+    # Bounded in-memory session storage (LRU eviction + TTL expiry)
+    # Each entry stores (state, created_timestamp) for TTL-based cleanup
+    return InMemorySessionStore(
+        maxsize=settings.SESSION_MAX_ENTRIES,
+        ttl_seconds=settings.SESSION_TTL_SECONDS,
+    )
+
+
+_sessions: SessionStore[CocktailFlowState] = _create_session_store()
+
+# Number of distinct START requests whose results are kept for replay
+FLOW_REPLAY_MAX_ENTRIES = 1000
+
+# Completed START results keyed by a hash of the request inputs, so retries
+# and refreshes with identical inputs skip the LLM run
+# (disabled unless FLOW_REPLAY_TTL_SECONDS > 0)
+_flow_replays: InMemorySessionStore[CocktailFlowState] = InMemorySessionStore(
+    maxsize=FLOW_REPLAY_MAX_ENTRIES,
+    ttl_seconds=get_settings().FLOW_REPLAY_TTL_SECONDS,
+)
+
+# Replay cache outcome of the current START request ("HIT" or "MISS"),
+# surfaced as the X-Cache response header; None when replay is not in play
+_replay_status: ContextVar[str | None] = ContextVar("flow_replay_status", default=None)
+
+
+def get_session_store() -> SessionStore[CocktailFlowState]:
+    """Get the session store used by the flow endpoints."""
+    return _sessions
 
-def cleanup_expired_sessions() -> int:
+
+async def cleanup_expired_sessions() -> int:
     """Remove expired sessions based on SESSION_TTL_SECONDS.
 
     Returns:
         Number of sessions removed.
     """
-    settings = get_settings()
-    now = time.time()
-    expired_ids = [
-        session_id
-        for session_id, (_, created_at) in _sessions.items()
-        if now - created_at > settings.SESSION_TTL_SECONDS
-    ]
-    for session_id in expired_ids:
-        del _sessions[session_id]
-    if expired_ids:
-        logger.info(f"Cleaned up {len(expired_ids)} expired flow sessions")
-    return len(expired_ids)
-
-
-def get_session_count() -> int:
+    removed = await get_session_store().cleanup_expired()
+    if removed:
+        logger.info(f"Cleaned up {removed} expired flow sessions")
+    return removed
+
+
+async def get_session_count() -> int:
     """Get the current number of active sessions.
 
     Returns:
         Number of active sessions.
     """
-    return len(_sessions)
+    return await _sessions.count()
+
+
+async def close_session_store() -> None:
+    """Release connections held by the session store on shutdown."""
+    await _sessions.close()
 
 
 class FlowAction(str, Enum):
@@ -197,12 +241,21 @@ class FlowResponse(BaseModel):
     )
 
 
+# RecipeData fields read from recipe dicts stored on the flow state
+_RECIPE_DICT_KEYS = tuple(RecipeData.model_fields)
+
+
 def _state_to_response(
     state: CocktailFlowState, message: str | None = None
 ) -> FlowResponse:
-    """Convert CocktailFlowState to FlowResponse."""
+    """Convert CocktailFlowState to FlowResponse.
+
+    The state was produced and validated by the flow, so response models are
+    built with model_construct to skip re-validation. Recipe dicts are the
+    exception and are still validated, since their shape is not guaranteed.
+    """
     if state.error:
-        return FlowResponse(
+        return FlowResponse.model_construct(
             session_id=state.session_id,
             success=False,
             message=None,
@@ -213,110 +266,85 @@ def _state_to_response(
         )
 
     recipe_data: RecipeData | None = None
-    if state.recipe:
-        if isinstance(state.recipe, RecipeOutput):
-            ingredients = (
-                [
-                    {
-                        "amount": f"{ing.amount} {ing.unit}".strip(),
-                        "name": ing.item,
-                    }
-                    for ing in state.recipe.ingredients
-                ]
-                if state.recipe.ingredients
-                else None
-            )
-
-            method = (
-                [
-                    {
-                        "step": i + 1,
-                        "instruction": f"{step.action}: {step.detail}"
-                        if step.action
-                        else step.detail,
-                    }
-                    for i, step in enumerate(state.recipe.method)
-                ]
-                if state.recipe.method
-                else None
+    match state.recipe or None:
+        case RecipeOutput() as recipe:
+            # One model_dump for the whole recipe, then reshape plain dicts
+            raw = recipe.model_dump()
+
+            ingredients = [
+                {
+                    "amount": f"{ing['amount']} {ing['unit']}".strip(),
+                    "name": ing["item"],
+                }
+                for ing in raw["ingredients"]
+            ]
+
+            method = [
+                {
+                    "step": i,
+                    "instruction": f"{step['action']}: {step['detail']}"
+                    if step["action"]
+                    else step["detail"],
+                }
+                for i, step in enumerate(raw["method"], start=1)
+            ]
+
+            recipe_data = RecipeData.model_construct(
+                id=raw["id"],
+                name=raw["name"],
+                tagline=raw["tagline"],
+                why=raw["why"],
+                ingredients=ingredients or None,
+                method=method or None,
+                glassware=raw["glassware"],
+                garnish=raw["garnish"],
+                timing=raw["timing"],
+                difficulty=raw["difficulty"],
+                technique_tips=raw["technique_tips"] or None,
+                is_mocktail=raw["is_mocktail"],
+                flavor_profile=raw["flavor_profile"] or None,
             )
-
-            technique_tips = (
-                [tip.model_dump() for tip in state.recipe.technique_tips]
-                if state.recipe.technique_tips
-                else None
-            )
-
-            flavor_profile = (
-                state.recipe.flavor_profile.model_dump()
-                if state.recipe.flavor_profile
-                else None
-            )
-
-            recipe_data = RecipeData(
-                id=state.recipe.id,
-                name=state.recipe.name,
-                tagline=state.recipe.tagline,
-                why=state.recipe.why,
-                ingredients=ingredients,
-                method=method,
-                glassware=state.recipe.glassware,
-                garnish=state.recipe.garnish,
-                timing=state.recipe.timing,
-                difficulty=state.recipe.difficulty,
-                technique_tips=technique_tips,
-                is_mocktail=state.recipe.is_mocktail,
-                flavor_profile=flavor_profile,
-            )
-        elif isinstance(state.recipe, dict):
-            recipe_data = RecipeData(
-                id=state.recipe.get("id") or state.selected,
-                name=state.recipe.get("name"),
-                raw_content=state.recipe.get("raw_content"),
-                tagline=state.recipe.get("tagline"),
-                why=state.recipe.get("why"),
-                ingredients=state.recipe.get("ingredients"),
-                method=state.recipe.get("method"),
-                glassware=state.recipe.get("glassware"),
-                garnish=state.recipe.get("garnish"),
-                timing=state.recipe.get("timing"),
-                difficulty=state.recipe.get("difficulty"),
-                technique_tips=state.recipe.get("technique_tips"),
-                is_mocktail=state.recipe.get("is_mocktail"),
-                flavor_profile=state.recipe.get("flavor_profile"),
-            )
-        else:
-            recipe_data = RecipeData(
+        case dict() as recipe:
+            fields = {key: recipe.get(key) for key in _RECIPE_DICT_KEYS}
+            fields["id"] = fields["id"] or state.selected
+            recipe_data = RecipeData.model_validate(fields)
+        case None:
+            if state.selected:
+                recipe_data = RecipeData.model_construct(id=state.selected)
+        case other:
+            recipe_data = RecipeData.model_construct(
                 id=state.selected,
-                raw_content=str(state.recipe),
+                raw_content=str(other),
             )
-    elif state.selected:
-        recipe_data = RecipeData(id=state.selected)
 
     next_bottle: BottleRecData | None = None
     if state.next_bottle and isinstance(state.next_bottle, dict):
         ingredient = state.next_bottle.get("ingredient")
         unlocks = state.next_bottle.get("unlocks")
         if ingredient and unlocks is not None:
-            ingredient_name = state.next_bottle.get("ingredient_name")
-            if not ingredient_name:
-                ingredient_name = ingredient.replace("-", " ").title()
-            next_bottle = BottleRecData(
+            ingredient_name = (
+                state.next_bottle.get("ingredient_name")
+                or load_ingredient_display_names().get(ingredient)
+                or ingredient_display_name(ingredient)
+            )
+            next_bottle = BottleRecData.model_construct(
                 ingredient=ingredient,
                 ingredient_name=ingredient_name,
                 unlocks=unlocks,
                 drinks=state.next_bottle.get("drinks") or [],
             )
 
-    alternatives: list[dict[str, Any]] | None = None
-    if state.candidates:
+    # The flow precomputes alternatives when it selects a drink; states built
+    # elsewhere fall back to filtering the candidates here
+    alternatives = state.alternatives
+    if alternatives is None and state.candidates:
         alternatives = [
             candidate
             for candidate in state.candidates
             if candidate.get("id") != state.selected
         ]
 
-    return FlowResponse(
+    return FlowResponse.model_construct(
         session_id=state.session_id,
         success=True,
         message=message or "Recommendation generated successfully",
@@ -329,20 +357,47 @@ def _state_to_response(
 
 @router.post("/flow", response_model=FlowResponse)
 @rate_limit_llm
-async def flow_endpoint(flow_request: FlowRequest) -> FlowResponse:
-    """Unified endpoint for all cocktail flow operations."""
+async def flow_endpoint(flow_request: FlowRequest) -> Response:
+    """Unified endpoint for all cocktail flow operations.
+
+    The FlowResponse is serialized once with model_dump_json and returned as
+    raw JSON, skipping FastAPI's response_model re-validation and encoding.
+    START requests with replay enabled also report the replay cache outcome
+    in an X-Cache header.
+    """
     logger.info(f"Flow endpoint called with action: {flow_request.action}")
 
-    if flow_request.action == FlowAction.START:
-        return await _handle_start(flow_request)
-    elif flow_request.action == FlowAction.ANOTHER:
-        return await _handle_another(flow_request)
-    elif flow_request.action == FlowAction.MADE:
-        return await _handle_made(flow_request)
-    else:
+    handler = _ACTION_HANDLERS.get(flow_request.action)
+    if handler is None:
         raise HTTPException(
             status_code=400, detail=f"Unknown action: {flow_request.action}"
         )
+    response = await handler(flow_request)
+
+    replay_status = _replay_status.get()
+    headers = {"X-Cache": replay_status} if replay_status else None
+    return Response(
+        content=response.model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+def _start_replay_key(request: FlowRequest) -> str:
+    """Build the replay cache key for a START request.
+
+    Order-insensitive inputs are sorted so equivalent requests share a key.
+    """
+    inputs = {
+        "cabinet": sorted(request.cabinet or []),
+        "mood": request.mood or "",
+        "skill_level": request.skill_level or SkillLevel.INTERMEDIATE,
+        "drink_type": request.drink_type or DrinkType.COCKTAIL,
+        "recent_history": sorted(request.recent_history or []),
+        "constraints": sorted(request.constraints or []),
+        "include_bottle_advice": request.include_bottle_advice,
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
 
 
 async def _handle_start(request: FlowRequest) -> FlowResponse:
@@ -359,17 +414,29 @@ async def _handle_start(request: FlowRequest) -> FlowResponse:
         f"include_bottle_advice={request.include_bottle_advice}"
     )
 
-    state = await run_cocktail_flow(
-        cabinet=request.cabinet,
-        mood=request.mood or "",
-        skill_level=request.skill_level or SkillLevel.INTERMEDIATE,
-        drink_type=request.drink_type or DrinkType.COCKTAIL,
-        recent_history=request.recent_history or [],
-        constraints=request.constraints or [],
-        include_bottle_advice=request.include_bottle_advice,
-    )
+    replay_key = _start_replay_key(request) if _flow_replays.ttl_seconds > 0 else None
+    replayed = await _flow_replays.load(replay_key) if replay_key else None
+    if replay_key:
+        _replay_status.set("MISS" if replayed is None else "HIT")
+    if replayed is not None:
+        # Replay the earlier result under a fresh session; the copy keeps
+        # later MADE updates from leaking back into the cached state
+        state = replayed.model_copy(update={"session_id": str(uuid.uuid4())}, deep=True)
+        logger.info("Replaying cached START result")
+    else:
+        state = await run_cocktail_flow(
+            cabinet=request.cabinet,
+            mood=request.mood or "",
+            skill_level=request.skill_level or SkillLevel.INTERMEDIATE,
+            drink_type=request.drink_type or DrinkType.COCKTAIL,
+            recent_history=request.recent_history or [],
+            constraints=request.constraints or [],
+            include_bottle_advice=request.include_bottle_advice,
+        )
+        if replay_key and not state.error:
+            await _flow_replays.save(replay_key, state.model_copy(deep=True))
 
-    _sessions[state.session_id] = (state, time.time())
+    await get_session_store().save(state.session_id, state)
     logger.info(f"Created session {state.session_id}, selected={state.selected}")
 
     return _state_to_response(state)
@@ -383,13 +450,13 @@ async def _handle_another(request: FlowRequest) -> FlowResponse:
             detail="session_id is required for ANOTHER action",
         )
 
-    session_data = _sessions.get(request.session_id)
-    if not session_data:
+    store = get_session_store()
+    state = await store.load(request.session_id)
+    if state is None:
         raise HTTPException(
             status_code=404,
             detail=f"Session not found: {request.session_id}",
         )
-    state, created_at = session_data
 
     logger.info(
         f"Requesting another for session {request.session_id}, "
@@ -397,7 +464,10 @@ async def _handle_another(request: FlowRequest) -> FlowResponse:
     )
 
     new_state = await request_another(state)
-    _sessions[new_state.session_id] = (new_state, created_at)
+    # request_another hands back the loaded state unchanged when nothing was
+    # selected; only a fresh state needs writing back to the store
+    if new_state is not state:
+        await store.save(new_state.session_id, new_state)
     logger.info(
         f"Updated session {new_state.session_id}, new selection={new_state.selected}"
     )
@@ -418,22 +488,21 @@ async def _handle_made(request: FlowRequest) -> FlowResponse:
             detail="drink_id is required for MADE action",
         )
 
-    session_data = _sessions.get(request.session_id)
-    if not session_data:
+    store = get_session_store()
+    state = await store.load(request.session_id)
+    if state is None:
         raise HTTPException(
             status_code=404,
             detail=f"Session not found: {request.session_id}",
         )
-    state, created_at = session_data
 
     logger.info(
         f"Marking drink '{request.drink_id}' as made for session {request.session_id}"
     )
 
-    if request.drink_id not in state.recent_history:
-        state.recent_history.append(request.drink_id)
-
-    _sessions[state.session_id] = (state, created_at)
+    # Repeat MADE calls leave the state untouched, so skip the store write
+    if state.mark_made(request.drink_id):
+        await store.save(state.session_id, state)
 
     return FlowResponse(
         session_id=state.session_id,
@@ -444,3 +513,11 @@ async def _handle_made(request: FlowRequest) -> FlowResponse:
         alternatives=None,
         error=None,
     )
+
+
+# Handler for each flow action, looked up by flow_endpoint
+_ACTION_HANDLERS: dict[FlowAction, Callable[[FlowRequest], Awaitable[FlowResponse]]] = {
+    FlowAction.START: _handle_start,
+    FlowAction.ANOTHER: _handle_another,
+    FlowAction.MADE: _handle_made,
+}
@@ -1,12 +1,19 @@
 """Services for the Cocktail Cache application."""
 
 from src.app.services.data_loader import (
+    derived_cache,
     load_all_drinks,
+    load_async,
     load_cocktails,
+    load_drink_ingredient_sets,
+    load_drinks_by_id,
+    load_drinks_by_type,
+    load_ingredient_display_names,
     load_ingredients,
     load_mocktails,
     load_substitutions,
     load_unlock_scores,
+    reload_catalog,
 )
 from src.app.services.drink_data import (
     BottleRecommendation,
@@ -23,12 +30,19 @@ from src.app.services.drink_data import (
 
 __all__ = [
     # Data loader exports
+    "derived_cache",
     "load_all_drinks",
+    "load_async",
     "load_cocktails",
     "load_mocktails",
+    "load_drinks_by_id",
+    "load_drinks_by_type",
+    "load_drink_ingredient_sets",
+    "load_ingredient_display_names",
     "load_ingredients",
     "load_substitutions",
     "load_unlock_scores",
+    "reload_catalog",
     # Drink data service exports
     "BottleRecommendation",
     "DrinkTypeFilter",
@@ -4,15 +4,60 @@ This service provides type-safe access to the JSON data files,
 validating all data through Pydantic models on load.
 """
 
+import asyncio
 import json
+import sys
+from collections.abc import Callable
 from functools import lru_cache
 from pathlib import Path
+from typing import Any, Protocol, TypeVar
 
 from pydantic import TypeAdapter
 
 from src.app.models.drinks import Drink
 from src.app.models.ingredients import IngredientsDatabase, SubstitutionsDatabase
 from src.app.models.unlock_scores import UnlockedDrink
+from src.app.utils.text import smart_title_case
+
+T = TypeVar("T")
+
+
+class _CacheClearable(Protocol):
+    """A cached function whose cache can be cleared (as lru_cache wrappers are)."""
+
+    def cache_clear(self) -> None: ...
+
+
+F = TypeVar("F", bound=_CacheClearable)
+
+# Validates and serializes unlock_scores.json
+_unlock_scores_adapter: TypeAdapter[dict[str, list[UnlockedDrink]]] = TypeAdapter(
+    dict[str, list[UnlockedDrink]]
+)
+
+# In-flight cold loads, keyed by loader, so concurrent callers share one load
+_pending_loads: dict[Callable[..., Any], asyncio.Future[Any]] = {}
+
+# Caches built on top of the loaders elsewhere (prebuilt responses, indexes),
+# cleared together with the loader caches
+_derived_caches: list[_CacheClearable] = []
+
+
+def derived_cache(func: F) -> F:
+    """Register an lru_cache-wrapped function as derived from catalog data.
+
+    Registered caches are cleared by clear_cache(), so prebuilt responses
+    and indexes never outlive the data they were built from. Apply it on
+    top of @lru_cache.
+
+    Args:
+        func: A function wrapped with lru_cache
+
+    Returns:
+        The same function
+    """
+    _derived_caches.append(func)
+    return func
 
 
 def get_data_dir() -> Path:
@@ -33,8 +78,7 @@ def load_cocktails() -> list[Drink]:
         FileNotFoundError: If cocktails.json doesn't exist
     """
     data_path = get_data_dir() / "cocktails.json"
-    with open(data_path) as f:
-        raw_data = json.load(f)
+    raw_data = json.loads(data_path.read_bytes())
 
     # Validate each cocktail through Pydantic
     adapter = TypeAdapter(list[Drink])
@@ -53,8 +97,7 @@ def load_mocktails() -> list[Drink]:
         FileNotFoundError: If mocktails.json doesn't exist
     """
     data_path = get_data_dir() / "mocktails.json"
-    with open(data_path) as f:
-        raw_data = json.load(f)
+    raw_data = json.loads(data_path.read_bytes())
 
     adapter = TypeAdapter(list[Drink])
     return adapter.validate_python(raw_data)
@@ -70,6 +113,51 @@ def load_all_drinks() -> list[Drink]:
     return load_cocktails() + load_mocktails()
 
 
+@lru_cache(maxsize=1)
+def load_drinks_by_id() -> dict[str, Drink]:
+    """Load all drinks indexed by drink ID.
+
+    Returns:
+        Dictionary mapping drink IDs to validated Drink models
+    """
+    return {drink.id: drink for drink in load_all_drinks()}
+
+
+@lru_cache(maxsize=3)
+def load_drinks_by_type(drink_type: str) -> list[Drink]:
+    """Load all drinks filtered by drink type.
+
+    Args:
+        drink_type: 'cocktails', 'mocktails', or 'both'. Any other value is
+            treated as 'both'.
+
+    Returns:
+        List of validated Drink models matching the drink type
+    """
+    all_drinks = load_all_drinks()
+    if drink_type == "cocktails":
+        return [drink for drink in all_drinks if not drink.is_mocktail]
+    if drink_type == "mocktails":
+        return [drink for drink in all_drinks if drink.is_mocktail]
+    return all_drinks
+
+
+@lru_cache(maxsize=1)
+def load_drink_ingredient_sets() -> dict[str, frozenset[str]]:
+    """Load the lowercased ingredient IDs of every drink.
+
+    The drink catalog is static, so matching against a cabinet can reuse
+    these sets instead of rebuilding them on every request.
+
+    Returns:
+        Dictionary mapping drink IDs to frozensets of lowercased ingredient IDs
+    """
+    return {
+        drink.id: frozenset(ing.item.lower() for ing in drink.ingredients)
+        for drink in load_all_drinks()
+    }
+
+
 @lru_cache(maxsize=1)
 def load_ingredients() -> IngredientsDatabase:
     """Load and validate ingredients database.
@@ -81,10 +169,32 @@ def load_ingredients() -> IngredientsDatabase:
         ValidationError: If JSON data doesn't match schema
     """
     data_path = get_data_dir() / "ingredients.json"
-    with open(data_path) as f:
-        raw_data = json.load(f)
+    raw_data = json.loads(data_path.read_bytes())
+
+    ingredients_db = IngredientsDatabase.model_validate(raw_data)
+
+    # Ingredient IDs form a small fixed vocabulary that is used as a lookup
+    # key on every request, so intern them once here
+    for ing in ingredients_db.all_ingredients():
+        ing.id = sys.intern(ing.id)
 
-    return IngredientsDatabase.model_validate(raw_data)
+    return ingredients_db
+
+
+@lru_cache(maxsize=1)
+def load_ingredient_display_names() -> dict[str, str]:
+    """Load the display name of every ingredient in the database.
+
+    Uses each ingredient's primary name, title-cased the same way as the
+    /ingredients listing.
+
+    Returns:
+        Dictionary mapping ingredient IDs to display names
+    """
+    return {
+        ing.id: smart_title_case(ing.names[0])
+        for ing in load_ingredients().all_ingredients()
+    }
 
 
 @lru_cache(maxsize=1)
@@ -98,8 +208,7 @@ def load_substitutions() -> SubstitutionsDatabase:
         ValidationError: If JSON data doesn't match schema
     """
     data_path = get_data_dir() / "substitutions.json"
-    with open(data_path) as f:
-        raw_data = json.load(f)
+    raw_data = json.loads(data_path.read_bytes())
 
     return SubstitutionsDatabase.model_validate(raw_data)
 
@@ -115,12 +224,41 @@ def load_unlock_scores() -> dict[str, list[UnlockedDrink]]:
         ValidationError: If JSON data doesn't match schema
     """
     data_path = get_data_dir() / "unlock_scores.json"
-    with open(data_path) as f:
-        raw_data = json.load(f)
+    raw_data = json.loads(data_path.read_bytes())
 
     # Validate each entry
-    adapter = TypeAdapter(dict[str, list[UnlockedDrink]])
-    return adapter.validate_python(raw_data)
+    return _unlock_scores_adapter.validate_python(raw_data)
+
+
+async def load_async(loader: Callable[[], T]) -> T:
+    """Call a cached loader without blocking the event loop.
+
+    Warm caches are returned directly. On a cold cache the loader runs in a
+    worker thread, and concurrent callers await the same in-flight load
+    instead of each parsing the data files (single-flight).
+
+    Args:
+        loader: A zero-argument loader wrapped with lru_cache
+
+    Returns:
+        The loader's result
+    """
+    cache_info = getattr(loader, "cache_info", None)
+    if cache_info is not None and cache_info().currsize:
+        return loader()
+
+    future = _pending_loads.get(loader)
+    if future is None or future.get_loop() is not asyncio.get_running_loop():
+        future = asyncio.ensure_future(asyncio.to_thread(loader))
+        _pending_loads[loader] = future
+
+        def _forget(done: asyncio.Future[Any]) -> None:
+            if _pending_loads.get(loader) is done:
+                del _pending_loads[loader]
+
+        future.add_done_callback(_forget)
+    result: T = await asyncio.shield(future)
+    return result
 
 
 def clear_cache() -> None:
@@ -128,9 +266,26 @@ def clear_cache() -> None:
     load_cocktails.cache_clear()
     load_mocktails.cache_clear()
     load_all_drinks.cache_clear()
+    load_drinks_by_id.cache_clear()
+    load_drinks_by_type.cache_clear()
+    load_drink_ingredient_sets.cache_clear()
     load_ingredients.cache_clear()
+    load_ingredient_display_names.cache_clear()
     load_substitutions.cache_clear()
     load_unlock_scores.cache_clear()
+    for cached in _derived_caches:
+        cached.cache_clear()
+
+
+def reload_catalog() -> None:
+    """Reload all catalog data from disk.
+
+    Clears every loader and derived cache, then eagerly reloads the drink
+    catalog and ingredients so the next request does not pay for parsing.
+    """
+    clear_cache()
+    load_all_drinks()
+    load_ingredients()
 
 
 def save_drinks(drinks: list[Drink], filepath: Path) -> None:
@@ -143,12 +298,12 @@ def save_drinks(drinks: list[Drink], filepath: Path) -> None:
     Raises:
         ValidationError: If any drink doesn't match schema
     """
-    # Re-validate before saving
+    # Re-validate before saving, then serialize the validated models straight
+    # to JSON bytes without another dict round trip
     adapter = TypeAdapter(list[Drink])
     validated = adapter.validate_python([d.model_dump() for d in drinks])
 
-    with open(filepath, "w") as f:
-        json.dump([d.model_dump() for d in validated], f, indent=2)
+    filepath.write_bytes(adapter.dump_json(validated, indent=2))
 
 
 def save_ingredients(ingredients: IngredientsDatabase, filepath: Path) -> None:
@@ -158,8 +313,7 @@ def save_ingredients(ingredients: IngredientsDatabase, filepath: Path) -> None:
         ingredients: IngredientsDatabase model to save
         filepath: Path to save the JSON file
     """
-    with open(filepath, "w") as f:
-        json.dump(ingredients.model_dump(), f, indent=2)
+    filepath.write_bytes(ingredients.model_dump_json(indent=2).encode())
 
 
 def save_substitutions(substitutions: SubstitutionsDatabase, filepath: Path) -> None:
@@ -169,8 +323,7 @@ def save_substitutions(substitutions: SubstitutionsDatabase, filepath: Path) ->
         substitutions: SubstitutionsDatabase model to save
         filepath: Path to save the JSON file
     """
-    with open(filepath, "w") as f:
-        json.dump(substitutions.model_dump(), f, indent=2)
+    filepath.write_bytes(substitutions.model_dump_json(indent=2).encode())
 
 
 def save_unlock_scores(scores: dict[str, list[UnlockedDrink]], filepath: Path) -> None:
@@ -180,7 +333,5 @@ def save_unlock_scores(scores: dict[str, list[UnlockedDrink]], filepath: Path) -
         scores: Dictionary of ingredient ID to unlocked drinks
         filepath: Path to save the JSON file
     """
-    # Convert UnlockedDrink models to dicts
-    output = {ing: [d.model_dump() for d in drinks] for ing, drinks in scores.items()}
-    with open(filepath, "w") as f:
-        json.dump(output, f, indent=2)
+    # Serialize the models straight to JSON bytes without a dict round trip
+    filepath.write_bytes(_unlock_scores_adapter.dump_json(scores, indent=2))
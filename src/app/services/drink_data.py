@@ -13,11 +13,13 @@ We now have:
 
 import logging
 import time
+from operator import itemgetter
 from typing import Literal, TypeAlias, TypedDict
 
 from src.app.services.data_loader import (
     load_all_drinks,
     load_cocktails,
+    load_drink_ingredient_sets,
     load_mocktails,
     load_substitutions,
     load_unlock_scores,
@@ -318,6 +320,7 @@ def get_unlock_recommendations(
 
     cabinet_set = {ing.lower().strip() for ing in cabinet}
     unlock_scores = load_unlock_scores()
+    drink_ingredient_sets = load_drink_ingredient_sets()
 
     # Load drinks to filter by type
     if drink_type == "cocktails":
@@ -327,8 +330,8 @@ def get_unlock_recommendations(
     else:
         drinks = load_all_drinks()
 
-    drink_ids = {d.id.lower() for d in drinks}
-    logger.debug(f"Analyzing unlock potential against {len(drink_ids)} drinks")
+    drinks_by_id = {d.id.lower(): d for d in drinks}
+    logger.debug(f"Analyzing unlock potential against {len(drinks_by_id)} drinks")
 
     # Calculate unlocks for each potential new ingredient
     recommendations: list[BottleRecommendation] = []
@@ -341,19 +344,13 @@ def get_unlock_recommendations(
         # Filter unlocks to drink type
         # unlocked_drinks is a list of UnlockedDrink objects
         relevant_unlocks: list[str] = []
+        # Would be makeable if we add this ingredient and have all others
+        would_have = cabinet_set | {ingredient_id.lower()}
         for unlocked in unlocked_drinks:
-            if unlocked.id.lower() in drink_ids:
-                # Check if this drink would become makeable
-                drink = next(
-                    (d for d in drinks if d.id.lower() == unlocked.id.lower()),
-                    None,
-                )
-                if drink:
-                    required = {ing.item.lower() for ing in drink.ingredients}
-                    # Would be makeable if we add this ingredient and have all others
-                    would_have = cabinet_set | {ingredient_id.lower()}
-                    if required.issubset(would_have):
-                        relevant_unlocks.append(unlocked.name)
+            drink = drinks_by_id.get(unlocked.id.lower())
+            # Check if this drink would become makeable
+            if drink and drink_ingredient_sets[drink.id] <= would_have:
+                relevant_unlocks.append(unlocked.name)
 
         if relevant_unlocks:
             recommendations.append(
@@ -366,7 +363,7 @@ def get_unlock_recommendations(
             )
 
     # Sort by unlocks count (descending)
-    recommendations.sort(key=lambda x: x["unlocks"], reverse=True)
+    recommendations.sort(key=itemgetter("unlocks"), reverse=True)
 
     elapsed_ms = (time.perf_counter() - start_time) * 1000
     total_unlocks = sum(r["unlocks"] for r in recommendations[:top_n])
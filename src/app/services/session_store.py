@@ -0,0 +1,198 @@
+"""Session storage for flow state.
+
+Sessions are kept in a bounded in-memory store by default: entries expire
+after a TTL measured from session creation, and the least recently used
+session is evicted once the store is full. Callers depend on the
+SessionStore protocol, so the Redis store can replace the in-memory one
+for multi-worker deployments (SESSION_BACKEND=redis).
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Generic, Protocol, TypeVar
+
+from pydantic import BaseModel
+
+StateT = TypeVar("StateT")
+ModelStateT = TypeVar("ModelStateT", bound=BaseModel)
+
+
+class SessionStore(Protocol[StateT]):
+    """Interface for session storage backends."""
+
+    async def load(self, session_id: str) -> StateT | None:
+        """Get the state for a session, or None if missing or expired."""
+        ...
+
+    async def save(self, session_id: str, state: StateT) -> None:
+        """Store the state for a session, keeping its original creation time."""
+        ...
+
+    async def touch(self, session_id: str) -> None:
+        """Mark a session as recently used."""
+        ...
+
+    async def cleanup_expired(self) -> int:
+        """Remove expired sessions and return how many were removed."""
+        ...
+
+    async def count(self) -> int:
+        """Get the number of stored sessions."""
+        ...
+
+    async def close(self) -> None:
+        """Release any connections held by the store."""
+        ...
+
+
+class InMemorySessionStore(OrderedDict[str, tuple[StateT, float]]):
+    """Size-capped LRU store with TTL expiry.
+
+    Entries map session IDs to (state, created_at) tuples, ordered from
+    least to most recently used. Writing past maxsize evicts the least
+    recently used session.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+
+    def __setitem__(self, session_id: str, entry: tuple[StateT, float]) -> None:
+        super().__setitem__(session_id, entry)
+        self.move_to_end(session_id)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    async def load(self, session_id: str) -> StateT | None:
+        """Get the state for a session, or None if missing or expired."""
+        entry = super().get(session_id)
+        if entry is None:
+            return None
+        state, created_at = entry
+        if time.time() - created_at > self.ttl_seconds:
+            del self[session_id]
+            return None
+        self.move_to_end(session_id)
+        return state
+
+    async def save(self, session_id: str, state: StateT) -> None:
+        """Store the state for a session, keeping its original creation time."""
+        entry = super().get(session_id)
+        created_at = entry[1] if entry is not None else time.time()
+        self[session_id] = (state, created_at)
+
+    async def touch(self, session_id: str) -> None:
+        """Mark a session as recently used."""
+        if session_id in self:
+            self.move_to_end(session_id)
+
+    async def cleanup_expired(self) -> int:
+        """Remove expired sessions and return how many were removed."""
+        now = time.time()
+        expired_ids = [
+            session_id
+            for session_id, (_, created_at) in self.items()
+            if now - created_at > self.ttl_seconds
+        ]
+        for session_id in expired_ids:
+            del self[session_id]
+        return len(expired_ids)
+
+    async def count(self) -> int:
+        """Get the number of stored sessions."""
+        return len(self)
+
+    async def close(self) -> None:
+        """Release any connections held by the store (none in memory)."""
+
+
+class RedisSessionStore(Generic[ModelStateT]):
+    """Redis-backed store shared across worker processes.
+
+    States are stored as JSON under "<key_prefix><session_id>" with a Redis
+    expiry of ttl_seconds, so Redis handles TTL expiry natively. Re-saving a
+    session keeps its remaining TTL, matching the in-memory store's
+    creation-time expiry. Eviction under memory pressure is left to the
+    server's maxmemory-policy. The client is a redis.asyncio client, so
+    store calls never block the event loop.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        state_type: type[ModelStateT],
+        ttl_seconds: int,
+        key_prefix: str = "session:",
+    ) -> None:
+        self.client = client
+        self.state_type = state_type
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+    @classmethod
+    def from_url(
+        cls,
+        url: str,
+        state_type: type[ModelStateT],
+        ttl_seconds: int,
+        key_prefix: str = "session:",
+    ) -> "RedisSessionStore[ModelStateT]":
+        """Create a store connected to the Redis server at url.
+
+        Raises:
+            ImportError: If the optional redis package is not installed.
+        """
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise ImportError(
+                "SESSION_BACKEND=redis requires the redis package "
+                "(uv sync --extra redis)"
+            ) from e
+
+        return cls(Redis.from_url(url), state_type, ttl_seconds, key_prefix)
+
+    def _key(self, session_id: str) -> str:
+        return f"{self.key_prefix}{session_id}"
+
+    async def load(self, session_id: str) -> ModelStateT | None:
+        """Get the state for a session, or None if missing or expired."""
+        raw = await self.client.get(self._key(session_id))
+        if raw is None:
+            return None
+        return self.state_type.model_validate_json(raw)
+
+    async def save(self, session_id: str, state: ModelStateT) -> None:
+        """Store the state for a session, keeping its original expiry."""
+        key = self._key(session_id)
+        payload = state.model_dump_json()
+        # One MULTI/EXEC transaction: a new session is created with a fresh
+        # expiry, then the value is written without resetting the TTL, so
+        # concurrent writers cannot race between the two commands
+        async with self.client.pipeline(transaction=True) as pipe:
+            pipe.set(key, payload, nx=True, ex=self.ttl_seconds)
+            pipe.set(key, payload, xx=True, keepttl=True)
+            await pipe.execute()
+
+    async def touch(self, session_id: str) -> None:
+        """Mark a session as recently used (Redis tracks access itself)."""
+
+    async def cleanup_expired(self) -> int:
+        """Remove expired sessions; Redis expires keys itself, so none are."""
+        return 0
+
+    async def count(self) -> int:
+        """Get the number of stored sessions.
+
+        Walks this store's keys with SCAN, so it is O(sessions); it is only
+        used for the periodic cleanup log, never on the request path.
+        """
+        count = 0
+        async for _ in self.client.scan_iter(match=f"{self.key_prefix}*", count=1000):
+            count += 1
+        return count
+
+    async def close(self) -> None:
+        """Close the Redis client and its connection pool."""
+        await self.client.aclose()
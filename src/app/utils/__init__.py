@@ -1,5 +1,10 @@
 """Utility functions for the cocktail cache app."""
 
 from src.app.utils.parsing import parse_json_from_llm_output
+from src.app.utils.text import ingredient_display_name, smart_title_case
 
-__all__ = ["parse_json_from_llm_output"]
+__all__ = [
+    "ingredient_display_name",
+    "parse_json_from_llm_output",
+    "smart_title_case",
+]
@@ -0,0 +1,32 @@
+"""Text formatting utilities for ingredient and drink names."""
+
+from functools import lru_cache
+
+
+def smart_title_case(text: str) -> str:
+    """
+    Convert text to title case, handling apostrophes correctly.
+
+    Args:
+        text: Text to convert, e.g. "maker's mark"
+
+    Returns:
+        Title-cased text with single spaces between words, e.g. "Maker's Mark"
+    """
+    # str.capitalize lowercases everything after the first character, so
+    # letters following an apostrophe stay lowercase ("maker's" -> "Maker's")
+    return " ".join(map(str.capitalize, text.split()))
+
+
+@lru_cache(maxsize=2048)
+def ingredient_display_name(ingredient_id: str) -> str:
+    """
+    Convert a kebab-case ingredient ID to a human-readable name.
+
+    Args:
+        ingredient_id: Ingredient ID, e.g. "sweet-vermouth"
+
+    Returns:
+        Display name, e.g. "Sweet Vermouth"
+    """
+    return smart_title_case(ingredient_id.replace("-", " "))
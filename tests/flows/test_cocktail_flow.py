@@ -107,6 +107,23 @@ class TestCocktailFlowStateHistory:
         state = CocktailFlowState()
         assert state.recent_history == []
 
+    def test_mark_made_skips_drinks_already_in_history(self):
+        """mark_made appends new drinks once and reports duplicates."""
+        state = CocktailFlowState(recent_history=["old-fashioned"])
+
+        assert state.mark_made("old-fashioned") is False
+        assert state.mark_made("manhattan") is True
+        assert state.mark_made("manhattan") is False
+        assert state.recent_history == ["old-fashioned", "manhattan"]
+
+    def test_mark_made_sees_reassigned_history(self):
+        """mark_made checks the current recent_history after reassignment."""
+        state = CocktailFlowState(recent_history=["a"])
+        state.recent_history = []
+
+        assert state.mark_made("a") is True
+        assert state.recent_history == ["a"]
+
     def test_default_rejected_is_empty(self):
         """Default rejected list should be empty."""
         state = CocktailFlowState()
@@ -157,6 +174,12 @@ class TestCocktailFlowStateOutputs:
         assert state.candidates == candidates
         assert len(state.candidates) == 2
 
+    def test_alternatives_are_not_serialized(self):
+        """Derived alternatives are excluded from state dumps."""
+        state = CocktailFlowState(alternatives=[{"id": "manhattan"}])
+        assert state.alternatives == [{"id": "manhattan"}]
+        assert "alternatives" not in state.model_dump()
+
 
 class TestCocktailFlowStateJsonSchema:
     """Tests for CocktailFlowState JSON schema compatibility."""
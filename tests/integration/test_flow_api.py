@@ -26,7 +26,12 @@ from src.app.models import (
 from src.app.models.recipe import RecipeIngredient, RecipeStep
 
 # Import from the new flow router location
-from src.app.routers.flow import _sessions
+from src.app.routers.flow import (
+    FlowResponse,
+    _flow_replays,
+    _sessions,
+    _state_to_response,
+)
 
 # =============================================================================
 # Helper Functions
@@ -67,8 +72,10 @@ def api_client() -> TestClient:
 def clear_sessions():
     """Clear session storage before and after each test."""
     _sessions.clear()
+    _flow_replays.clear()
     yield
     _sessions.clear()
+    _flow_replays.clear()
 
 
 @pytest.fixture
@@ -214,6 +221,8 @@ class TestStartFlowAction:
         )
 
         assert response.status_code == 200
+        # Replay is disabled by default, so no cache status is reported
+        assert "x-cache" not in response.headers
         data = response.json()
 
         # Verify response structure
@@ -479,6 +488,35 @@ class TestStartFlowAction:
         state, _ = _sessions[session_id]
         assert state.selected == "whiskey-sour"
 
+    @patch("src.app.routers.flow.run_cocktail_flow")
+    def test_start_flow_replays_identical_request(
+        self,
+        mock_run_flow: MagicMock,
+        api_client: TestClient,
+        mock_flow_state: CocktailFlowState,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Identical START requests replay the cached result in a new session."""
+        monkeypatch.setattr(_flow_replays, "ttl_seconds", 60)
+        mock_run_flow.return_value = mock_flow_state
+
+        first_response = api_client.post(
+            "/api/flow",
+            json={"action": "START", "cabinet": ["bourbon", "lemons"]},
+        )
+        second_response = api_client.post(
+            "/api/flow",
+            json={"action": "START", "cabinet": ["lemons", "bourbon"]},
+        )
+        first, second = first_response.json(), second_response.json()
+
+        mock_run_flow.assert_called_once()
+        assert first_response.headers["x-cache"] == "MISS"
+        assert second_response.headers["x-cache"] == "HIT"
+        assert second["recipe"] == first["recipe"]
+        assert second["session_id"] != first["session_id"]
+        assert second["session_id"] in _sessions
+
 
 # =============================================================================
 # ANOTHER Action Tests
@@ -692,6 +730,28 @@ class TestMadeFlowAction:
         state, _ = _sessions["test-session-123"]
         assert state.recent_history.count("whiskey-sour") == 1
 
+    def test_made_duplicate_skips_store_write(
+        self, api_client: TestClient, mock_flow_state: CocktailFlowState
+    ):
+        """MADE for a drink already in history does not re-save the session."""
+        import time
+
+        mock_flow_state.recent_history = ["whiskey-sour"]
+        _sessions["test-session-123"] = (mock_flow_state, time.time())
+
+        with patch.object(_sessions, "save") as mock_save:
+            response = api_client.post(
+                "/api/flow",
+                json={
+                    "action": "MADE",
+                    "session_id": "test-session-123",
+                    "drink_id": "whiskey-sour",
+                },
+            )
+
+        assert response.status_code == 200
+        mock_save.assert_not_called()
+
     def test_made_adds_new_drink_to_history(
         self, api_client: TestClient, mock_flow_state: CocktailFlowState
     ):
@@ -1055,6 +1115,36 @@ class TestFlowEdgeCases:
         assert data["alternatives"] is None or len(data["alternatives"]) == 0
 
 
+class TestStateToResponse:
+    """Tests for converting flow state into a FlowResponse."""
+
+    def test_constructed_response_round_trips_through_json(self):
+        """Responses built without validation still match the schema."""
+        state = CocktailFlowState(
+            session_id="round-trip",
+            selected="old-fashioned",
+            recipe=create_simple_recipe("old-fashioned", "Old Fashioned"),
+            candidates=[{"id": "old-fashioned"}, {"id": "manhattan"}],
+            next_bottle={"ingredient": "sweet-vermouth", "unlocks": 3},
+        )
+
+        response = _state_to_response(state)
+        restored = FlowResponse.model_validate_json(response.model_dump_json())
+
+        assert restored.model_dump() == response.model_dump()
+
+    def test_next_bottle_name_falls_back_to_catalog_name(self):
+        """A next_bottle without a name uses the ingredient's catalog name."""
+        state = CocktailFlowState(
+            session_id="bottle-name",
+            next_bottle={"ingredient": "angostura", "unlocks": 2},
+        )
+
+        response = _state_to_response(state)
+
+        assert response.next_bottle.ingredient_name == "Angostura Bitters"
+
+
 # =============================================================================
 # Session Management Tests
 # =============================================================================
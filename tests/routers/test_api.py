@@ -5,8 +5,8 @@ Tests for:
 - GET /api/drinks - drink listing with pagination and filtering
 - GET /api/drinks/{drink_id} - individual drink details
 - POST /api/suggest-bottles - bottle recommendations based on cabinet
-- Helper functions: _smart_title_case, _format_ingredient_name,
-  _get_ingredient_display_name, _is_core_bottle
+- Helper functions: _format_ingredient_name, _load_core_bottle_bits
+- Bottle suggestion caches: category sets, drink requirements, suggestions
 """
 
 import os
@@ -20,8 +20,11 @@ os.environ.setdefault("ANTHROPIC_API_KEY", "test-key-not-used-for-actual-calls")
 
 from src.app.main import app
 from src.app.routers.bottles import (
-    _get_ingredient_display_name,
-    _is_core_bottle,
+    _compute_suggestions,
+    _load_core_bottle_bits,
+    _load_core_bottle_ids,
+    _load_drink_requirements,
+    _load_ingredient_category_sets,
 )
 
 # Import from the new sub-router locations
@@ -29,7 +32,6 @@ from src.app.routers.drinks import (
     CATEGORY_CONFIG,
     INGREDIENT_EMOJIS,
     _format_ingredient_name,
-    _smart_title_case,
 )
 
 # =============================================================================
@@ -43,49 +45,6 @@ def api_client() -> TestClient:
     return TestClient(app)
 
 
-# =============================================================================
-# Helper Function Tests: _smart_title_case
-# =============================================================================
-
-
-class TestSmartTitleCase:
-    """Tests for the _smart_title_case helper function."""
-
-    def test_simple_word(self):
-        """Single word is capitalized."""
-        assert _smart_title_case("bourbon") == "Bourbon"
-
-    def test_multiple_words(self):
-        """Multiple words are each capitalized."""
-        assert _smart_title_case("sweet vermouth") == "Sweet Vermouth"
-
-    def test_apostrophe_handling(self):
-        """Apostrophes are handled correctly - not capitalizing after them."""
-        assert _smart_title_case("lyre's") == "Lyre's"
-        assert _smart_title_case("maker's mark") == "Maker's Mark"
-
-    def test_empty_string(self):
-        """Empty string returns empty string."""
-        assert _smart_title_case("") == ""
-
-    def test_already_capitalized(self):
-        """Already capitalized text is normalized."""
-        assert _smart_title_case("BOURBON") == "Bourbon"
-
-    def test_mixed_case(self):
-        """Mixed case is normalized to title case."""
-        assert _smart_title_case("bOuRbOn") == "Bourbon"
-
-    def test_multiple_apostrophes(self):
-        """Multiple apostrophes in same word are handled."""
-        assert _smart_title_case("o'brien's") == "O'brien's"
-
-    def test_hyphenated_words_stay_together(self):
-        """Hyphenated words are treated as one unit (no hyphens in input)."""
-        # The function expects spaces, not hyphens
-        assert _smart_title_case("old fashioned") == "Old Fashioned"
-
-
 # =============================================================================
 # Helper Function Tests: _format_ingredient_name
 # =============================================================================
@@ -114,76 +73,80 @@ class TestFormatIngredientName:
 
 
 # =============================================================================
-# Helper Function Tests: _get_ingredient_display_name
-# =============================================================================
-
-
-class TestGetIngredientDisplayName:
-    """Tests for the _get_ingredient_display_name helper function."""
-
-    def test_kebab_case_conversion(self):
-        """Kebab-case is converted to title case with spaces."""
-        assert _get_ingredient_display_name("sweet-vermouth") == "Sweet Vermouth"
-
-    def test_single_word(self):
-        """Single word without hyphens is title-cased."""
-        assert _get_ingredient_display_name("bourbon") == "Bourbon"
-
-    def test_multiple_hyphens(self):
-        """Multiple hyphens are all converted to spaces."""
-        assert (
-            _get_ingredient_display_name("orange-juice-fresh") == "Orange Juice Fresh"
-        )
-
-    def test_apostrophe_in_id(self):
-        """Apostrophes in ingredient IDs are handled correctly."""
-        # Note: typically ingredient IDs don't have apostrophes, but test the edge case
-        assert _get_ingredient_display_name("lyres") == "Lyres"
-
-
-# =============================================================================
-# Helper Function Tests: _is_core_bottle
+# Helper Function Tests: _load_core_bottle_bits
 # =============================================================================
 
 
-class TestIsCoreBottle:
-    """Tests for the _is_core_bottle helper function.
+class TestCoreBottleBits:
+    """Tests for Core Bottle membership via _load_core_bottle_bits.
 
     Core Bottles are spirits, modifiers, and non-alcoholic spirits.
     """
 
     def test_spirit_is_core_bottle(self):
         """Spirits are identified as Core Bottles."""
-        assert _is_core_bottle("bourbon") is True
-        assert _is_core_bottle("gin") is True
-        assert _is_core_bottle("vodka") is True
+        assert "bourbon" in _load_core_bottle_bits()
+        assert "gin" in _load_core_bottle_bits()
+        assert "vodka" in _load_core_bottle_bits()
 
     def test_modifier_is_core_bottle(self):
         """Modifiers/liqueurs are identified as Core Bottles."""
-        assert _is_core_bottle("sweet-vermouth") is True
-        assert _is_core_bottle("dry-vermouth") is True
+        assert "sweet-vermouth" in _load_core_bottle_bits()
+        assert "dry-vermouth" in _load_core_bottle_bits()
 
     def test_fresh_is_not_core_bottle(self):
         """Fresh ingredients are not Core Bottles."""
-        assert _is_core_bottle("mint") is False
-        assert _is_core_bottle("lime-juice") is False
+        assert "mint" not in _load_core_bottle_bits()
+        assert "lime-juice" not in _load_core_bottle_bits()
 
     def test_mixer_is_not_core_bottle(self):
         """Mixers are not Core Bottles."""
-        assert _is_core_bottle("soda-water") is False
-        assert _is_core_bottle("tonic-water") is False
+        assert "soda-water" not in _load_core_bottle_bits()
+        assert "tonic-water" not in _load_core_bottle_bits()
 
     def test_syrup_is_not_core_bottle(self):
         """Syrups (Essentials) are not Core Bottles."""
-        assert _is_core_bottle("simple-syrup") is False
+        assert "simple-syrup" not in _load_core_bottle_bits()
 
     def test_bitters_is_not_core_bottle(self):
         """Bitters (Essentials) are not Core Bottles."""
-        assert _is_core_bottle("angostura") is False
+        assert "angostura" not in _load_core_bottle_bits()
 
     def test_unknown_ingredient_is_not_core_bottle(self):
         """Unknown ingredients are not Core Bottles."""
-        assert _is_core_bottle("unknown-ingredient-xyz") is False
+        assert "unknown-ingredient-xyz" not in _load_core_bottle_bits()
+
+
+# =============================================================================
+# Bottle Suggestion Cache Tests
+# =============================================================================
+
+
+class TestBottleSuggestionCaches:
+    """Tests for the cached catalog helpers behind bottle suggestions."""
+
+    def test_category_sets_are_built_once(self):
+        """Category ID sets are cached frozensets shared across calls."""
+        sets = _load_ingredient_category_sets()
+        assert sets is _load_ingredient_category_sets()
+        assert all(isinstance(ids, frozenset) for ids in sets)
+        assert "bourbon" in sets[0]
+
+    def test_drink_requirements_split_core_bottles(self):
+        """Per-drink requirements only list Core Bottles as bottles."""
+        core_bottle_ids = _load_core_bottle_ids()
+        assert set(core_bottle_ids) == _load_core_bottle_bits().keys()
+        for core_mask, _ in _load_drink_requirements().values():
+            assert core_mask.bit_length() <= len(core_bottle_ids)
+
+    def test_suggestions_are_cached_per_cabinet(self):
+        """Repeated cabinets reuse the computed non-AI suggestions."""
+        cabinet = frozenset({"bourbon", "sweet-vermouth"})
+        first = _compute_suggestions("both", cabinet, 5)
+
+        assert _compute_suggestions("both", cabinet, 5) is first
+        assert first[0].ai_summary is None
+        assert first[1] == ("bourbon", "sweet-vermouth")
 
 
 # =============================================================================
@@ -369,6 +332,55 @@ class TestGetDrinks:
         drink_ids = {d["id"] for d in data["drinks"]}
         assert "old-fashioned" in drink_ids
 
+    def test_drinks_sets_cache_headers(self, api_client: TestClient):
+        """Response carries an ETag and public Cache-Control header."""
+        response = api_client.get("/api/drinks")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["etag"]
+        assert response.headers["cache-control"] == "public, max-age=300"
+
+    def test_drinks_not_modified_when_etag_matches(self, api_client: TestClient):
+        """A matching If-None-Match returns 304 with no body."""
+        etag = api_client.get("/api/drinks").headers["etag"]
+
+        response = api_client.get("/api/drinks", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_drinks_not_modified_when_etag_in_list(self, api_client: TestClient):
+        """An If-None-Match list containing the ETag returns 304."""
+        etag = api_client.get("/api/drinks").headers["etag"]
+
+        response = api_client.get(
+            "/api/drinks", headers={"If-None-Match": f'"stale", {etag}'}
+        )
+
+        assert response.status_code == 304
+
+    def test_drinks_not_modified_for_weak_etag(self, api_client: TestClient):
+        """A weak W/ ETag matching the current one returns 304."""
+        etag = api_client.get("/api/drinks").headers["etag"]
+
+        response = api_client.get("/api/drinks", headers={"If-None-Match": f"W/{etag}"})
+
+        assert response.status_code == 304
+
+    def test_drinks_not_modified_for_wildcard(self, api_client: TestClient):
+        """If-None-Match: * returns 304."""
+        response = api_client.get("/api/drinks", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 304
+
+    def test_drinks_modified_when_etag_differs(self, api_client: TestClient):
+        """A non-matching If-None-Match returns the full body."""
+        response = api_client.get("/api/drinks", headers={"If-None-Match": '"stale"'})
+
+        assert response.status_code == 200
+        assert response.json()["drinks"]
+
 
 # =============================================================================
 # GET /api/drinks/{drink_id} Tests
@@ -553,7 +565,7 @@ class TestSuggestBottles:
         # All recommendations should be Core Bottles (spirits, modifiers, or non-alcoholic spirits)
         for rec in data["recommendations"]:
             ingredient_id = rec["ingredient_id"]
-            assert _is_core_bottle(ingredient_id), (
+            assert ingredient_id in _load_core_bottle_bits(), (
                 f"{ingredient_id} should be a Core Bottle ingredient"
             )
 
@@ -943,3 +955,32 @@ class TestErrorPages:
         response = api_client.get("/unknown-page-xyz")
 
         assert response.status_code == 404
+
+
+# =============================================================================
+# Application Lifespan Tests
+# =============================================================================
+
+
+class TestAppLifespan:
+    """Tests for application startup behavior."""
+
+    def test_startup_preloads_catalog(self):
+        """Starting the app loads the data files before the first request."""
+        from src.app.services.data_loader import (
+            clear_cache,
+            load_cocktails,
+            load_ingredients,
+            load_substitutions,
+            load_unlock_scores,
+        )
+
+        clear_cache()
+        with TestClient(app):
+            for loader in (
+                load_cocktails,
+                load_ingredients,
+                load_substitutions,
+                load_unlock_scores,
+            ):
+                assert loader.cache_info().currsize == 1
@@ -8,7 +8,10 @@ Tests cover:
 - Edge cases and error handling
 """
 
+import asyncio
 import json
+import sys
+from functools import lru_cache
 from pathlib import Path
 from unittest.mock import patch
 
@@ -24,13 +27,20 @@ from src.app.models.ingredients import (
 from src.app.models.unlock_scores import UnlockedDrink
 from src.app.services.data_loader import (
     clear_cache,
+    derived_cache,
     get_data_dir,
     load_all_drinks,
+    load_async,
     load_cocktails,
+    load_drink_ingredient_sets,
+    load_drinks_by_id,
+    load_drinks_by_type,
+    load_ingredient_display_names,
     load_ingredients,
     load_mocktails,
     load_substitutions,
     load_unlock_scores,
+    reload_catalog,
     save_drinks,
     save_ingredients,
     save_substitutions,
@@ -304,6 +314,75 @@ class TestCachingBehavior:
 
         assert first_call is second_call
 
+    def test_load_drinks_by_id_indexes_catalog(self):
+        """Test that drinks are indexed by ID over the cached catalog."""
+        drinks_by_id = load_drinks_by_id()
+
+        assert drinks_by_id is load_drinks_by_id()
+        assert all(drinks_by_id[drink.id] is drink for drink in load_all_drinks())
+
+    def test_clear_cache_clears_derived_caches(self):
+        """Test that derived caches are cleared with the loader caches."""
+
+        @derived_cache
+        @lru_cache(maxsize=1)
+        def drink_count() -> int:
+            return len(load_all_drinks())
+
+        drink_count()
+        clear_cache()
+
+        assert drink_count.cache_info().currsize == 0
+
+    def test_reload_catalog_rebuilds_caches(self):
+        """Test that reload_catalog clears and eagerly reloads the catalog."""
+        drinks = load_all_drinks()
+        reload_catalog()
+
+        assert load_all_drinks.cache_info().currsize == 1
+        assert load_all_drinks() is not drinks
+
+    def test_load_drinks_by_type_partitions_catalog(self):
+        """Test that drinks are partitioned by type and cached per type."""
+        cocktails = load_drinks_by_type("cocktails")
+        mocktails = load_drinks_by_type("mocktails")
+
+        assert cocktails is load_drinks_by_type("cocktails")
+        assert not any(drink.is_mocktail for drink in cocktails)
+        assert all(drink.is_mocktail for drink in mocktails)
+        assert load_drinks_by_type("both") == cocktails + mocktails
+
+    def test_load_drink_ingredient_sets_is_cached(self):
+        """Test that per-drink ingredient sets are built once and lowercased."""
+        sets = load_drink_ingredient_sets()
+
+        assert sets is load_drink_ingredient_sets()
+        for drink in load_all_drinks():
+            assert sets[drink.id] == {ing.item.lower() for ing in drink.ingredients}
+
+    def test_load_ingredient_display_names_uses_primary_name(self):
+        """Test that display names come from each ingredient's first name."""
+        names = load_ingredient_display_names()
+
+        assert names is load_ingredient_display_names()
+        assert len(names) == len(load_ingredients().all_ingredients())
+        assert names["angostura"] == "Angostura Bitters"
+
+    async def test_load_async_shares_single_cold_load(self):
+        """Test that concurrent load_async callers share one cold load."""
+        first, second = await asyncio.gather(
+            load_async(load_cocktails), load_async(load_cocktails)
+        )
+
+        assert first is second
+        assert load_cocktails.cache_info().misses == 1
+
+    async def test_load_async_returns_warm_cache(self):
+        """Test that load_async returns the cached object once warm."""
+        cached = load_ingredients()
+
+        assert await load_async(load_ingredients) is cached
+
 
 # =============================================================================
 # Test 15-21: Data Integrity
@@ -708,6 +787,13 @@ class TestIntegration:
         nonexistent = ingredients_db.find_by_id("nonexistent-ingredient")
         assert nonexistent is None
 
+    def test_ingredient_ids_are_interned(self):
+        """Test that loaded ingredient IDs are interned for fast lookups."""
+        ingredients_db = load_ingredients()
+
+        for ing in ingredients_db.all_ingredients():
+            assert ing.id is sys.intern(ing.id)
+
     def test_substitutions_find_substitutes_works(self):
         """Test the find_substitutes helper method on SubstitutionsDatabase."""
         substitutions = load_substitutions()
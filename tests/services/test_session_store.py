@@ -0,0 +1,157 @@
+"""Tests for the in-memory session store.
+
+Tests cover:
+- load/save round trips and creation time preservation
+- LRU eviction when the store is full
+- TTL expiry on load and in cleanup_expired
+- Redis store serialization and TTL handling (with an in-memory client)
+"""
+
+import fnmatch
+import time
+
+from src.app.flows.cocktail_flow import CocktailFlowState
+from src.app.services.session_store import InMemorySessionStore, RedisSessionStore
+
+
+class FakeRedis:
+    """Minimal async stand-in for the redis client commands the store uses."""
+
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.ttls: dict[str, int] = {}
+        self.closed = False
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    def set_now(self, key, value, ex=None, nx=False, xx=False, keepttl=False):
+        if (nx and key in self.data) or (xx and key not in self.data):
+            return None
+        self.data[key] = value
+        if not keepttl:
+            self.ttls[key] = ex
+        return True
+
+    async def scan_iter(self, match, count=None):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    async def aclose(self):
+        self.closed = True
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues set commands and applies them together on execute."""
+
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self.commands: list[tuple[tuple, dict]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    def set(self, *args, **kwargs):
+        self.commands.append((args, kwargs))
+        return self
+
+    async def execute(self):
+        return [self.client.set_now(*args, **kwargs) for args, kwargs in self.commands]
+
+
+class TestInMemorySessionStore:
+    """Tests for InMemorySessionStore."""
+
+    async def test_save_and_load_round_trip(self):
+        """Saved state is returned by load."""
+        store = InMemorySessionStore(maxsize=10, ttl_seconds=60)
+        await store.save("a", "state-a")
+
+        assert await store.load("a") == "state-a"
+        assert await store.load("missing") is None
+
+    async def test_save_keeps_original_creation_time(self):
+        """Re-saving a session does not extend its TTL."""
+        store = InMemorySessionStore(maxsize=10, ttl_seconds=60)
+        store["a"] = ("old", 123.0)
+        await store.save("a", "new")
+
+        assert store["a"] == ("new", 123.0)
+
+    async def test_evicts_least_recently_used(self):
+        """The least recently used session is evicted past maxsize."""
+        store = InMemorySessionStore(maxsize=2, ttl_seconds=60)
+        await store.save("a", 1)
+        await store.save("b", 2)
+        await store.load("a")
+        await store.save("c", 3)
+
+        assert "a" in store
+        assert "b" not in store
+        assert len(store) == 2
+
+    async def test_load_drops_expired_session(self):
+        """Expired sessions are removed when loaded."""
+        store = InMemorySessionStore(maxsize=10, ttl_seconds=60)
+        store["a"] = ("state", time.time() - 120)
+
+        assert await store.load("a") is None
+        assert "a" not in store
+
+    async def test_cleanup_expired_removes_only_expired(self):
+        """cleanup_expired removes expired sessions and reports the count."""
+        store = InMemorySessionStore(maxsize=10, ttl_seconds=60)
+        store["old"] = ("state", time.time() - 120)
+        await store.save("fresh", "state")
+
+        assert await store.cleanup_expired() == 1
+        assert list(store) == ["fresh"]
+
+
+class TestRedisSessionStore:
+    """Tests for RedisSessionStore."""
+
+    async def test_save_and_load_round_trip(self):
+        """States are stored as JSON and validated back into the model."""
+        client = FakeRedis()
+        store = RedisSessionStore(client, CocktailFlowState, 60, key_prefix="flow:")
+        state = CocktailFlowState(session_id="a", cabinet=["gin"], mood="relaxed")
+        await store.save("a", state)
+
+        assert isinstance(client.data["flow:a"], str)
+        assert await store.load("a") == state
+        assert await store.load("missing") is None
+        assert await store.count() == 1
+
+    async def test_count_only_includes_store_keys(self):
+        """count ignores keys outside the store's prefix; close closes the client."""
+        client = FakeRedis()
+        client.data["other:key"] = "value"
+        store = RedisSessionStore(client, CocktailFlowState, 60, key_prefix="flow:")
+        await store.save("a", CocktailFlowState(session_id="a"))
+
+        assert await store.count() == 1
+
+        await store.close()
+        assert client.closed
+
+    async def test_save_keeps_original_expiry(self):
+        """Re-saving a session keeps its TTL; new sessions get a fresh one."""
+        client = FakeRedis()
+        store = RedisSessionStore(client, CocktailFlowState, 60, key_prefix="flow:")
+        await store.save("a", CocktailFlowState(session_id="a"))
+        assert client.ttls["flow:a"] == 60
+        client.ttls["flow:a"] = 5  # Simulate time passing
+
+        await store.save("a", CocktailFlowState(session_id="a", mood="updated"))
+
+        assert client.ttls["flow:a"] == 5
+        assert (await store.load("a")).mood == "updated"
+        assert await store.cleanup_expired() == 0
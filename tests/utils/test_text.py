@@ -0,0 +1,76 @@
+"""Tests for the text utility module.
+
+Tests for:
+- smart_title_case: Title-case names while keeping apostrophes lowercase
+- ingredient_display_name: Convert kebab-case ingredient IDs to display names
+"""
+
+from src.app.utils.text import ingredient_display_name, smart_title_case
+
+# =============================================================================
+# smart_title_case Tests
+# =============================================================================
+
+
+class TestSmartTitleCase:
+    """Tests for the smart_title_case function."""
+
+    def test_simple_word(self):
+        """Single word is capitalized."""
+        assert smart_title_case("bourbon") == "Bourbon"
+
+    def test_multiple_words(self):
+        """Multiple words are each capitalized."""
+        assert smart_title_case("sweet vermouth") == "Sweet Vermouth"
+
+    def test_apostrophe_handling(self):
+        """Apostrophes are handled correctly - not capitalizing after them."""
+        assert smart_title_case("lyre's") == "Lyre's"
+        assert smart_title_case("maker's mark") == "Maker's Mark"
+
+    def test_empty_string(self):
+        """Empty string returns empty string."""
+        assert smart_title_case("") == ""
+
+    def test_already_capitalized(self):
+        """Already capitalized text is normalized."""
+        assert smart_title_case("BOURBON") == "Bourbon"
+
+    def test_mixed_case(self):
+        """Mixed case is normalized to title case."""
+        assert smart_title_case("bOuRbOn") == "Bourbon"
+
+    def test_multiple_apostrophes(self):
+        """Multiple apostrophes in same word are handled."""
+        assert smart_title_case("o'brien's") == "O'brien's"
+
+    def test_hyphenated_words_stay_together(self):
+        """Hyphenated words are treated as one unit (no hyphens in input)."""
+        # The function expects spaces, not hyphens
+        assert smart_title_case("old fashioned") == "Old Fashioned"
+
+
+# =============================================================================
+# ingredient_display_name Tests
+# =============================================================================
+
+
+class TestIngredientDisplayName:
+    """Tests for the ingredient_display_name function."""
+
+    def test_kebab_case_conversion(self):
+        """Kebab-case is converted to title case with spaces."""
+        assert ingredient_display_name("sweet-vermouth") == "Sweet Vermouth"
+
+    def test_single_word(self):
+        """Single word without hyphens is title-cased."""
+        assert ingredient_display_name("bourbon") == "Bourbon"
+
+    def test_multiple_hyphens(self):
+        """Multiple hyphens are all converted to spaces."""
+        assert ingredient_display_name("orange-juice-fresh") == "Orange Juice Fresh"
+
+    def test_apostrophe_in_id(self):
+        """Apostrophes in ingredient IDs are handled correctly."""
+        # Note: typically ingredient IDs don't have apostrophes, but test the edge case
+        assert ingredient_display_name("lyres") == "Lyres"